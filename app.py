@@ -1,4 +1,5 @@
 import streamlit as st
+import uuid
 from datetime import datetime, timedelta
 from main import main # Import the main function from your modularized code
 
@@ -9,6 +10,10 @@ def app():
     """
     st.set_page_config(page_title="Smart Travel Planner", layout="centered")
 
+    # One checkpoint thread per browser session so edit-and-resubmit only re-runs changed steps
+    if "thread_id" not in st.session_state:
+        st.session_state.thread_id = str(uuid.uuid4())
+
     st.title("✈️ Smart Travel Planner")
     st.markdown("Plan your next trip with AI-powered itineraries and cost estimates!")
 
@@ -48,7 +53,7 @@ def app():
                 try:
                     # Call the main function from your modularized code
                     # The main function should now return the summary string
-                    trip_summary = main(location, start_date_str, end_date_str)
+                    trip_summary = main(location, start_date_str, end_date_str, thread_id=st.session_state.thread_id)
                     print(trip_summary)
                     st.success("Trip planned successfully!")
                     st.subheader("Your Trip Summary:")
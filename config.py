@@ -8,4 +8,7 @@ load_dotenv()
 AMADEUS_API_KEY = os.getenv('AMADEUS_CLIENT_ID')
 AMADEUS_API_SECRET = os.getenv('AMADEUS_CLIENT_SECRET')
 OPENAI_API_KEY = os.getenv('OPENAI_API')
-TAVILY_API_KEY = os.getenv('TAVILY_API_KEY')
\ No newline at end of file
+TAVILY_API_KEY = os.getenv('TAVILY_API_KEY')
+
+# Local SQLite file used to checkpoint graph runs for incremental re-planning
+CHECKPOINT_DB = os.getenv('CHECKPOINT_DB', 'travel_checkpoints.sqlite')
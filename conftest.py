@@ -0,0 +1,14 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def graph(tmp_path_factory):
+    """The graph module, checkpointing to a per-session temp database."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("CHECKPOINT_DB", str(tmp_path_factory.mktemp("checkpoints") / "checkpoints.sqlite"))
+        # tools.py builds its API clients at import time; they are never called in tests
+        mp.setenv("OPENAI_API", "test")
+        mp.setenv("TAVILY_API_KEY", "test")
+        import graph
+        yield graph
+        graph.checkpointer.conn.close()
@@ -1,5 +1,9 @@
 from langgraph.graph import StateGraph, END
-from typing import TypedDict, Optional
+from langgraph.checkpoint.sqlite import SqliteSaver
+from typing import TypedDict, Optional, Annotated
+import hashlib
+import json
+import sqlite3
 import config
 
 from tools import (
@@ -9,7 +13,8 @@ from tools import (
     calculate_fees_tool,
     fetch_hotel_tool,
     calculate_total_tool,
-    final_summary_tool
+    final_summary_tool,
+    trip_days
 )
 
 class TravelState(TypedDict):
@@ -23,23 +28,63 @@ class TravelState(TypedDict):
     hotel_info: Optional[dict]
     total_cost: Optional[float]
     summary: Optional[str]
+    node_cache: Annotated[Optional[dict], lambda old, new: {**(old or {}), **(new or {})}]
 
 def router(state):
     return state["weather_status"]
 
+# Inputs each node depends on. A node is only re-executed when it has not seen
+# these inputs before on the same thread; otherwise its checkpointed outputs are
+# reused (e.g. changing only the dates keeps the itinerary and fees).
+NODE_INPUTS = {
+    "check_weather": lambda s: [s["location"], s["start_date"], s["end_date"], s.get("loop_count") or 0],
+    "suggest_alternate": lambda s: [s["start_date"], s.get("loop_count") or 0],
+    "build_itinerary": lambda s: [s["location"], trip_days(s["start_date"], s["end_date"])],
+    "calculate_fees": lambda s: [s["location"], s["itinerary"]],
+    "fetch_hotel": lambda s: [s["location"], s["start_date"], s["end_date"]],
+    "calculate_total": lambda s: [s["entrance_fees"], s["hotel_info"]],
+    "final_summary": lambda s: [s["location"], s["start_date"], s["end_date"], s["itinerary"], s["total_cost"]],
+}
+
+# Cached results kept per node, so both weather checks of the rain loop survive
+MAX_CACHE_ENTRIES = 4
+
+def inputs_key(inputs):
+    """Short, stable key for a node's inputs so the checkpoint doesn't store them in full."""
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+def cached_node(name, run):
+    """Wrap a node so it reuses earlier outputs when its inputs are unchanged.
+
+    Outputs flagged with ``fallback`` (placeholder values after a failed API call)
+    are passed on but not cached, so the next run retries the call.
+    """
+    def node(state):
+        key = inputs_key(NODE_INPUTS[name](state))
+        entries = (state.get("node_cache") or {}).get(name) or {}
+        if key in entries:
+            print(f"♻️ Reusing checkpointed result: {name}")
+            return entries[key]
+        outputs = dict(run(state))
+        if outputs.pop("fallback", False):
+            return outputs
+        entries = list(entries.items())[-(MAX_CACHE_ENTRIES - 1):] + [(key, outputs)]
+        return {**outputs, "node_cache": {name: dict(entries)}}
+    return node
+
 # Graph nodes
 workflow = StateGraph(TravelState)
-workflow.add_node("check_weather", lambda s: check_weather_tool.invoke(s))
-workflow.add_node("suggest_alternate", lambda s: suggest_alternate_tool.invoke(s))
-workflow.add_node("build_itinerary", lambda s: build_itinerary_tool.invoke(s))
-workflow.add_node("calculate_fees", lambda s: calculate_fees_tool.invoke(s))
-workflow.add_node("fetch_hotel", lambda s: fetch_hotel_tool.invoke({
+workflow.add_node("check_weather", cached_node("check_weather", lambda s: check_weather_tool.invoke(s)))
+workflow.add_node("suggest_alternate", cached_node("suggest_alternate", lambda s: suggest_alternate_tool.invoke(s)))
+workflow.add_node("build_itinerary", cached_node("build_itinerary", lambda s: build_itinerary_tool.invoke(s)))
+workflow.add_node("calculate_fees", cached_node("calculate_fees", lambda s: calculate_fees_tool.invoke(s)))
+workflow.add_node("fetch_hotel", cached_node("fetch_hotel", lambda s: fetch_hotel_tool.invoke({
     "city_code": s["location"],
     "start_date": s["start_date"],
     "end_date": s["end_date"]
-}))
-workflow.add_node("calculate_total", lambda s: calculate_total_tool.invoke(s))
-workflow.add_node("final_summary", lambda s: final_summary_tool.invoke(s))
+})))
+workflow.add_node("calculate_total", cached_node("calculate_total", lambda s: calculate_total_tool.invoke(s)))
+workflow.add_node("final_summary", cached_node("final_summary", lambda s: final_summary_tool.invoke(s)))
 
 # Edges
 workflow.set_entry_point("check_weather")
@@ -54,5 +99,25 @@ workflow.add_edge("fetch_hotel", "calculate_total")
 workflow.add_edge("calculate_total", "final_summary")
 workflow.add_edge("final_summary", END)
 
-# Compile and run
-travel_app = workflow.compile()
\ No newline at end of file
+# Compile with a persistent SQLite checkpointer so re-planning on the same
+# thread only re-runs nodes whose inputs changed
+checkpointer = SqliteSaver(sqlite3.connect(config.CHECKPOINT_DB, check_same_thread=False))
+travel_app = workflow.compile(checkpointer=checkpointer)
+
+# One-off runs (no thread to resume) skip checkpointing entirely
+travel_app_uncached = workflow.compile()
+
+# Thread ids never outlive the process that created them, so start from an empty store
+with checkpointer.cursor() as cur:
+    cur.execute("DELETE FROM checkpoints")
+    cur.execute("DELETE FROM writes")
+
+def prune_thread(thread_id):
+    """Drop every checkpoint of a thread except the latest, which holds the cache to resume from."""
+    with checkpointer.cursor() as cur:
+        for table in ("checkpoints", "writes"):
+            cur.execute(
+                f"DELETE FROM {table} WHERE thread_id = ? AND checkpoint_id < "
+                "(SELECT MAX(checkpoint_id) FROM checkpoints WHERE thread_id = ?)",
+                (thread_id, thread_id),
+            )
@@ -1,9 +1,13 @@
-from graph import travel_app
+from graph import travel_app, travel_app_uncached, prune_thread
 from datetime import datetime
 import config
 
-def main(city, start_date, end_date):
-    """Main function demonstrating smart hotel search"""
+def main(city, start_date, end_date, thread_id=None):
+    """Main function demonstrating smart hotel search.
+
+    With a ``thread_id`` the run is checkpointed, so re-planning the same trip with
+    new dates reuses nodes whose inputs are unchanged. Without one nothing is stored.
+    """
     
     # Initial state for the graph
     inputs = {
@@ -15,7 +19,11 @@ def main(city, start_date, end_date):
 
     # Run the travel planning workflow
     print(f"Initiating travel planning for {city} from {start_date} to {end_date}")
-    result = travel_app.invoke(inputs)
+    if thread_id:
+        result = travel_app.invoke(inputs, config={"configurable": {"thread_id": thread_id}})
+        prune_thread(thread_id)
+    else:
+        result = travel_app_uncached.invoke(inputs)
 
     # You can now access the final state or specific outputs
     if result.get("summary"):
@@ -0,0 +1,110 @@
+import uuid
+
+import pytest
+
+
+class StubTool:
+    """Stands in for a @tool: records each call and returns a fixed result."""
+
+    def __init__(self, name, calls, result):
+        self.name = name
+        self.calls = calls
+        self.result = result
+
+    def invoke(self, args):
+        self.calls.append(self.name)
+        return self.result(args) if callable(self.result) else dict(self.result)
+
+
+@pytest.fixture
+def calls(graph, monkeypatch):
+    calls = []
+    stubs = {
+        "check_weather_tool": {"weather_status": "build_itinerary"},
+        "suggest_alternate_tool": {},
+        "build_itinerary_tool": {"itinerary": "Day 1 | Morning | Museum"},
+        "calculate_fees_tool": {"entrance_fees": [10.0]},
+        "fetch_hotel_tool": lambda a: {"hotel_info": {"Hotel Name": a["start_date"], "Total Cost": 100.0}},
+        "calculate_total_tool": lambda a: {"total_cost": sum(a["entrance_fees"]) + a["hotel_info"]["Total Cost"]},
+        "final_summary_tool": lambda a: {"summary": f"{a['start_date']} to {a['end_date']}"},
+    }
+    for attr, result in stubs.items():
+        monkeypatch.setattr(graph, attr, StubTool(attr[:-len("_tool")], calls, result))
+    return calls
+
+
+@pytest.fixture
+def plan(graph):
+    def plan(thread_id, start_date, end_date):
+        inputs = {"location": "Chennai", "start_date": start_date, "end_date": end_date, "loop_count": 0}
+        result = graph.travel_app.invoke(inputs, config={"configurable": {"thread_id": thread_id}})
+        graph.prune_thread(thread_id)
+        return result
+    return plan
+
+
+def test_date_shift_reruns_only_date_dependent_nodes(calls, plan):
+    thread_id = str(uuid.uuid4())
+    plan(thread_id, "2025-07-20", "2025-07-23")
+    assert calls == ["check_weather", "build_itinerary", "calculate_fees",
+                     "fetch_hotel", "calculate_total", "final_summary"]
+
+    calls.clear()
+    result = plan(thread_id, "2025-07-21", "2025-07-24")
+    assert calls == ["check_weather", "fetch_hotel", "calculate_total", "final_summary"]
+    assert result["summary"] == "2025-07-21 to 2025-07-24"
+
+
+def test_trip_length_change_rebuilds_itinerary(calls, plan):
+    thread_id = str(uuid.uuid4())
+    plan(thread_id, "2025-07-20", "2025-07-23")
+    calls.clear()
+    plan(thread_id, "2025-07-20", "2025-07-25")
+    assert "build_itinerary" in calls
+
+
+def test_fallback_results_are_not_cached(graph, calls, plan, monkeypatch):
+    monkeypatch.setattr(graph, "fetch_hotel_tool", StubTool("fetch_hotel", calls, {
+        "hotel_info": {"Hotel Name": "Fallback Hotel", "Total Cost": 200.0}, "fallback": True}))
+    thread_id = str(uuid.uuid4())
+    result = plan(thread_id, "2025-07-20", "2025-07-23")
+    assert "fallback" not in result
+    calls.clear()
+    plan(thread_id, "2025-07-20", "2025-07-23")
+    assert calls == ["fetch_hotel"]
+
+
+def test_rain_loop_resubmit_reuses_both_weather_checks(graph, calls, plan, monkeypatch):
+    monkeypatch.setattr(graph, "check_weather_tool", StubTool("check_weather", calls, lambda a: {
+        "weather_status": "suggest_alternate" if a["loop_count"] == 0 else "build_itinerary"}))
+    monkeypatch.setattr(graph, "suggest_alternate_tool", StubTool("suggest_alternate", calls, lambda a: {
+        "start_date": "2025-07-23", "end_date": "2025-07-26", "loop_count": a["loop_count"] + 1}))
+    thread_id = str(uuid.uuid4())
+    plan(thread_id, "2025-07-20", "2025-07-23")
+    assert calls.count("check_weather") == 2
+    calls.clear()
+    plan(thread_id, "2025-07-20", "2025-07-23")
+    assert calls == []
+
+
+def test_cache_stores_input_hashes_not_inputs(graph, calls, plan):
+    thread_id = str(uuid.uuid4())
+    plan(thread_id, "2025-07-20", "2025-07-23")
+    cache = graph.travel_app.get_state({"configurable": {"thread_id": thread_id}}).values["node_cache"]
+    assert all(len(key) == 64 for entries in cache.values() for key in entries)
+
+
+def test_prune_keeps_only_latest_checkpoint(graph, calls, plan):
+    thread_id = str(uuid.uuid4())
+    plan(thread_id, "2025-07-20", "2025-07-23")
+    plan(thread_id, "2025-07-21", "2025-07-24")
+    with graph.checkpointer.cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM checkpoints WHERE thread_id = ?", (thread_id,))
+        assert cur.fetchone()[0] == 1
+    calls.clear()
+    plan(thread_id, "2025-07-21", "2025-07-24")
+    assert calls == []
+
+
+def test_trip_days_counts_both_ends(graph):
+    assert graph.trip_days("2025-07-20", "2025-07-23") == 4
@@ -61,12 +61,20 @@ def suggest_alternate_tool(start_date: str, loop_count: Optional[int] = 0) -> di
     print(f"📆 New Dates: {new_start} - {new_end}")
     return {"start_date": new_start, "end_date": new_end, "loop_count": loop_count + 1}
 
+def trip_days(start_date: str, end_date: str) -> int:
+    """Number of days the trip covers, counting both the start and end date."""
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    return (end - start).days + 1
+
 @tool
 def build_itinerary_tool(location: str, start_date: str, end_date: str) -> dict:
     """Builds a day-by-day itinerary for the given location and travel start date."""
 
     print("📝 Running: build_itinerary_tool")
-    prompt = f"Create an itinerary for {location} from {start_date} to {end_date}. 3 activities/day: morning, afternoon, evening."
+    # Only the trip length goes into the prompt so the itinerary can be reused when the dates shift
+    days = trip_days(start_date, end_date)
+    prompt = f"Create a {days}-day itinerary for {location}, labelled Day 1 to Day {days}. 3 activities/day: morning, afternoon, evening."
     itinerary = llm.predict(prompt)
     print("✅ Itinerary ready.")
     return {"itinerary": itinerary}
@@ -76,6 +84,7 @@ def calculate_fees_tool(location: str, itinerary: str) -> dict:
     """Calculates the total entrance or activity fees based on the provided itinerary."""
 
     print("💰 Running: calculate_fees_tool")
+    failed = []
 
     def get_fee(activity):
         query = f"USD entrance ticket cost for {activity} in {location}"
@@ -87,12 +96,16 @@ def calculate_fees_tool(location: str, itinerary: str) -> dict:
             match = re.search(r"\\$?(\\d+(?:\\.\\d{1,2})?)", content)
             return float(match.group(1)) if match else 0.0
         except:
+            failed.append(activity)
             return 0.0
 
     activity_lines = [line for line in itinerary.split("\\n") if "|" in line]
     activity_names = [line.split("|")[2].strip() for line in activity_lines]
     fees = [get_fee(a) for a in activity_names]
     print(f"🎟️ Fetched fees for {len(fees)} activities.")
+    if failed:
+        # Lookup errors were priced at 0.0; flag them so the result is not checkpointed
+        return {"entrance_fees": fees, "fallback": True}
     return {"entrance_fees": fees}
 
 @tool
@@ -145,10 +158,10 @@ def fetch_hotel_tool(city_code: str, start_date: str, end_date: str) -> dict:
 
         else:
             print("❌ No hotel offers found")
-            return {"hotel_info": {"Hotel Name": "Fallback Hotel", "Total Cost": 200.0}}
+            return {"hotel_info": {"Hotel Name": "Fallback Hotel", "Total Cost": 200.0}, "fallback": True}
     else:
         print("❌ Failed to retrieve hotel data")
-        return {"hotel_info": {"Hotel Name": "Fallback Hotel", "Total Cost": 200.0}}
+        return {"hotel_info": {"Hotel Name": "Fallback Hotel", "Total Cost": 200.0}, "fallback": True}
 
 
 @tool